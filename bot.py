@@ -1,71 +1,314 @@
+import asyncio
+import hashlib
+import inspect
 import os
+import aiohttp
 import numpy as np
 import pandas as pd
-import requests
+import talib
+
+from strategies.base_strategy import BaseStrategy
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is optional: without it prepare_data runs the TA-Lib helpers
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so kernels can still be defined."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# ---------------------------
+# Indicator Settings
+# ---------------------------
+
+_BB_WINDOW = 20
+_BB_K = 2.0
+_RSI_PERIOD = 14
+_MACD_FAST = 12
+_MACD_SLOW = 26
+_MACD_SIGNAL = 9
+_MACD_ALPHAS = (2.0 / (_MACD_FAST + 1), 2.0 / (_MACD_SLOW + 1), 2.0 / (_MACD_SIGNAL + 1))
+_ATR_PERIOD = 14
+_VOL_PERIOD = 24
+# Leading rows that are NaN in at least one indicator (the 24-bar volume
+# average dominates; RSI needs period + 1 bars because of the first diff)
+_WARMUP = max(_BB_WINDOW, _RSI_PERIOD + 1, _ATR_PERIOD, _VOL_PERIOD) - 1
+
+# Confluence score inputs: columns read from the last two bars and the
+# Bollinger / RSI / MACD / Volume weights (in %)
+_CONFLUENCE_COLS = ['close', 'LowerBand', 'UpperBand', 'BandWidth', 'RSI',
+                    'MACD', 'Signal', 'MACD_Hist', 'VolSpike', 'OBV']
+_CONFLUENCE_W = np.array([40, 25, 20, 15], dtype=np.int32)
+# Latest-bar values used for position sizing and trade parameters
+_TRADE_COLS = ['close', 'SMA', 'UpperBand', 'LowerBand', 'BandWidth', 'ATR', 'RSI']
+
+# ---------------------------
+# Numerical Kernels
+# ---------------------------
+
+@njit(cache=True, fastmath=True)
+def _ema(x, alpha):
+    """Exponential moving average seeded with x[0] (pandas ewm adjust=False)."""
+    n = x.shape[0]
+    y = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return y
+    y[0] = x[0]
+    for i in range(1, n):
+        y[i] = alpha * x[i] + (1 - alpha) * y[i - 1]
+    return y
+
+def _ema_ewm(x, alpha):
+    """pandas fallback for _ema."""
+    return pd.Series(x).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+@njit(cache=True)
+def _compute_all(high, low, close, vol,
+                 out_bb_u, out_bb_m, out_bb_l, out_bw,
+                 out_rsi, out_macd, out_sig, out_hist,
+                 out_atr, out_obv, out_volavg, out_volspike):
+    """
+    Fused indicator kernel: streams high/low/close/volume once and fills every
+    output array in the same loop. Inputs may be float32; all running state
+    is kept in float64. Matches bollinger_bands, rsi, macd, atr, obv and
+    volume_spike up to float32 rounding (tests/test_indicator_backends.py).
+    """
+    bb_w = _BB_WINDOW
+    bb_k = _BB_K
+    rsi_p = _RSI_PERIOD
+    atr_p = _ATR_PERIOD
+    vol_p = _VOL_PERIOD
+    a_fast, a_slow, a_sig = _MACD_ALPHAS
+
+    n = close.shape[0]
+    s = 0.0
+    s2 = 0.0
+    gain_sum = 0.0
+    loss_sum = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    sig = 0.0
+    tr_sum = 0.0
+    obv = 0.0
+    vol_sum = 0.0
+    for i in range(n):
+        c = np.float64(close[i])
+
+        # Bollinger Bands (running sum / sum of squares, sample std)
+        s += c
+        s2 += c * c
+        if i >= bb_w:
+            old = np.float64(close[i - bb_w])
+            s -= old
+            s2 -= old * old
+        if i < bb_w - 1:
+            out_bb_u[i] = np.nan
+            out_bb_m[i] = np.nan
+            out_bb_l[i] = np.nan
+            out_bw[i] = np.nan
+        else:
+            mean = s / bb_w
+            var = (s2 - s * mean) / (bb_w - 1)
+            if var < 0.0:
+                var = 0.0
+            band = bb_k * np.sqrt(var)
+            out_bb_u[i] = mean + band
+            out_bb_m[i] = mean
+            out_bb_l[i] = mean - band
+            out_bw[i] = 2.0 * band / c * 100
+
+        # RSI (Wilder's RMA, seeded with the mean of the first rsi_p diffs)
+        delta = c - np.float64(close[i - 1]) if i > 0 else 0.0
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        if i <= rsi_p:
+            gain_sum += gain
+            loss_sum += loss
+            if i == rsi_p:
+                avg_gain = gain_sum / rsi_p
+                avg_loss = loss_sum / rsi_p
+        else:
+            avg_gain = (avg_gain * (rsi_p - 1) + gain) / rsi_p
+            avg_loss = (avg_loss * (rsi_p - 1) + loss) / rsi_p
+        if i < rsi_p:
+            out_rsi[i] = np.nan
+        else:
+            out_rsi[i] = 100 - (100 / (1 + avg_gain / (avg_loss + 1e-10)))
+
+        # MACD (EMAs seeded with the first value, like ewm(adjust=False))
+        if i == 0:
+            ema_fast = c
+            ema_slow = c
+        else:
+            ema_fast = a_fast * c + (1 - a_fast) * ema_fast
+            ema_slow = a_slow * c + (1 - a_slow) * ema_slow
+        m = ema_fast - ema_slow
+        sig = m if i == 0 else a_sig * m + (1 - a_sig) * sig
+        out_macd[i] = m
+        out_sig[i] = sig
+        out_hist[i] = m - sig
+
+        # ATR (simple rolling mean of the true range)
+        h = np.float64(high[i])
+        lo = np.float64(low[i])
+        tr = h - lo
+        if i > 0:
+            pc = np.float64(close[i - 1])
+            if abs(h - pc) > tr:
+                tr = abs(h - pc)
+            if abs(lo - pc) > tr:
+                tr = abs(lo - pc)
+        tr_sum += tr
+        if i >= atr_p:
+            # Drop the true range that just left the window
+            j = i - atr_p
+            hj = np.float64(high[j])
+            lj = np.float64(low[j])
+            tr_old = hj - lj
+            if j > 0:
+                pc = np.float64(close[j - 1])
+                if abs(hj - pc) > tr_old:
+                    tr_old = abs(hj - pc)
+                if abs(lj - pc) > tr_old:
+                    tr_old = abs(lj - pc)
+            tr_sum -= tr_old
+        out_atr[i] = np.nan if i < atr_p - 1 else tr_sum / atr_p
+
+        # OBV
+        if delta > 0.0:
+            obv += vol[i]
+        elif delta < 0.0:
+            obv -= vol[i]
+        out_obv[i] = obv
+
+        # Volume spike (volume 20% above its rolling average)
+        v = np.float64(vol[i])
+        vol_sum += v
+        if i >= vol_p:
+            vol_sum -= vol[i - vol_p]
+        if i < vol_p - 1:
+            out_volavg[i] = np.nan
+            out_volspike[i] = False
+        else:
+            out_volavg[i] = vol_sum / vol_p
+            out_volspike[i] = v > 1.2 * out_volavg[i]
+
+    return None
+
+def kernel_fingerprint():
+    """
+    Hash of _compute_all's source and the settings numba bakes into it, as
+    a positive int64. The AOT build embeds it so a stale binary is detected.
+    """
+    source = inspect.getsource(getattr(_compute_all, 'py_func', _compute_all))
+    settings = repr((_BB_WINDOW, _BB_K, _RSI_PERIOD, _MACD_ALPHAS, _ATR_PERIOD, _VOL_PERIOD))
+    return int(hashlib.sha256((source + settings).encode()).hexdigest()[:15], 16)
+
+try:
+    # Ahead-of-time build of _compute_all (python -m strategies._kernels_build);
+    # ignored unless it was built from the current kernel source and settings
+    from strategies import indicator_kernels
+    if indicator_kernels.kernel_version() != kernel_fingerprint():
+        print("strategies/indicator_kernels is out of date; rebuild it with "
+              "python -m strategies._kernels_build. Using the JIT kernel instead.")
+        indicator_kernels = None
+except (ImportError, AttributeError):
+    indicator_kernels = None
 
 # ---------------------------
 # Technical Indicator Functions
 # ---------------------------
 
-def bollinger_bands(df, window=20, num_std=2):
+def ohlcv_arrays(df, dtype=np.float64):
+    """
+    Return the high/low/close/volume columns as contiguous arrays of `dtype`.
+    Build this once per frame and pass it to the indicator helpers so they
+    do not each convert the same columns again. The helpers call TA-Lib and
+    need float64; the fused kernel takes float32, which keeps ~7 significant
+    digits, plenty for threshold-based signals, and halves the memory it
+    streams (it accumulates in float64 internally).
+    """
+    return {name: np.ascontiguousarray(df[name].to_numpy(dtype=dtype))
+            for name in ('high', 'low', 'close', 'volume')}
+
+def bollinger_bands(df, window=_BB_WINDOW, num_std=_BB_K, arrays=None):
     """Calculate Bollinger Bands and band width (in % of price)."""
-    df['SMA'] = df['close'].rolling(window).mean()
-    df['STD'] = df['close'].rolling(window).std()
-    df['UpperBand'] = df['SMA'] + num_std * df['STD']
-    df['LowerBand'] = df['SMA'] - num_std * df['STD']
+    close = (arrays or ohlcv_arrays(df))['close']
+    # TA-Lib uses the population std; scale the multiplier so the bands match
+    # the sample std (ddof=1) used everywhere else
+    nbdev = num_std * np.sqrt(window / (window - 1))
+    upper, mid, lower = talib.BBANDS(close, timeperiod=window, nbdevup=nbdev, nbdevdn=nbdev, matype=0)
+    df['SMA'] = mid
+    df['UpperBand'] = upper
+    df['LowerBand'] = lower
     # Band width in percentage: (upper - lower) / close * 100
-    df['BandWidth'] = (df['UpperBand'] - df['LowerBand']) / df['close'] * 100
+    df['BandWidth'] = (upper - lower) / close * 100
     return df
 
-def rsi(df, period=14):
-    """Calculate Relative Strength Index (RSI)."""
-    delta = df['close'].diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-    avg_gain = gain.rolling(period).mean()
-    avg_loss = loss.rolling(period).mean()
-    rs = avg_gain / (avg_loss + 1e-10)
-    df['RSI'] = 100 - (100 / (1 + rs))
+def rsi(df, period=_RSI_PERIOD, arrays=None):
+    """Calculate Relative Strength Index (RSI) with Wilder's smoothing."""
+    close = (arrays or ohlcv_arrays(df))['close']
+    df['RSI'] = talib.RSI(close, timeperiod=period)
     return df
 
-def macd(df, fast=12, slow=26, signal_period=9):
-    """Calculate MACD line, signal line and histogram."""
-    df['EMA_fast'] = df['close'].ewm(span=fast, adjust=False).mean()
-    df['EMA_slow'] = df['close'].ewm(span=slow, adjust=False).mean()
-    df['MACD'] = df['EMA_fast'] - df['EMA_slow']
-    df['Signal'] = df['MACD'].ewm(span=signal_period, adjust=False).mean()
-    df['MACD_Hist'] = df['MACD'] - df['Signal']
+def macd(df, fast=_MACD_FAST, slow=_MACD_SLOW, signal_period=_MACD_SIGNAL, arrays=None):
+    """
+    Calculate MACD line, signal line and histogram.
+    Not talib.MACD: that seeds its EMAs with an SMA and leaves the first
+    slow + signal_period - 2 values NaN, unlike ewm(adjust=False).
+    """
+    close = (arrays or ohlcv_arrays(df))['close']
+    ema = _ema if NUMBA_AVAILABLE else _ema_ewm
+    if (fast, slow, signal_period) == (_MACD_FAST, _MACD_SLOW, _MACD_SIGNAL):
+        a_fast, a_slow, a_sig = _MACD_ALPHAS
+    else:
+        a_fast, a_slow, a_sig = (2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (signal_period + 1))
+    ema_fast = ema(close, a_fast)
+    ema_slow = ema(close, a_slow)
+    macd_line = ema_fast - ema_slow
+    signal_line = ema(macd_line, a_sig)
+    df['MACD'] = macd_line
+    df['Signal'] = signal_line
+    df['MACD_Hist'] = macd_line - signal_line
     return df
 
-def atr(df, period=14):
-    """Calculate Average True Range (ATR)."""
-    high_low = df['high'] - df['low']
-    high_close = np.abs(df['high'] - df['close'].shift())
-    low_close = np.abs(df['low'] - df['close'].shift())
-    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    df['ATR'] = tr.rolling(period).mean()
+def atr(df, period=_ATR_PERIOD, arrays=None):
+    """
+    Calculate Average True Range (ATR) as a simple moving average of the
+    true range (talib.ATR would apply Wilder's smoothing instead).
+    """
+    arrays = arrays or ohlcv_arrays(df)
+    high, low, close = arrays['high'], arrays['low'], arrays['close']
+    # The first bar has no previous close, so its true range is high - low
+    # (talib.TRANGE would leave it NaN and delay the first ATR by a bar)
+    prev_close = np.concatenate((close[:1], close[:-1]))
+    tr = np.maximum.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+    df['ATR'] = talib.SMA(tr, timeperiod=period)
     return df
 
-def obv(df):
-    """Calculate On-Balance Volume (OBV)."""
-    obv_vals = [0]
-    for i in range(1, len(df)):
-        if df['close'].iloc[i] > df['close'].iloc[i-1]:
-            obv_vals.append(obv_vals[-1] + df['volume'].iloc[i])
-        elif df['close'].iloc[i] < df['close'].iloc[i-1]:
-            obv_vals.append(obv_vals[-1] - df['volume'].iloc[i])
-        else:
-            obv_vals.append(obv_vals[-1])
-    df['OBV'] = obv_vals
+def obv(df, arrays=None):
+    """Calculate On-Balance Volume (OBV), starting from 0 on the first bar."""
+    arrays = arrays or ohlcv_arrays(df)
+    close, vol = arrays['close'], arrays['volume']
+    df['OBV'] = talib.OBV(close, vol) - vol[:1]
     return df
 
-def volume_spike(df, period=24):
+def volume_spike(df, period=_VOL_PERIOD, arrays=None):
     """
     Flag a volume spike if current volume is 20% above the rolling average.
     Assume period=24 for hourly data (adjust if using 15m data).
     """
-    df['VolAvg'] = df['volume'].rolling(period).mean()
-    df['VolSpike'] = df['volume'] > 1.2 * df['VolAvg']
+    vol = (arrays or ohlcv_arrays(df))['volume']
+    vol_avg = talib.SMA(vol, timeperiod=period)
+    df['VolAvg'] = vol_avg
+    df['VolSpike'] = vol > 1.2 * vol_avg
     return df
 
 # ---------------------------
@@ -79,45 +322,33 @@ def calculate_confluence_score(df):
       - score: total percentage based on weights
     Weights: Bollinger (40), RSI (25), MACD (20), Volume (15)
     """
-    # Grab last row (latest data)
-    row = df.iloc[-1]
-    score_long = 0
-    score_short = 0
-
-    # 1. Bollinger Band Position + Squeeze (40%)
-    # For long: price touches lower band and low volatility (BandWidth < 0.5%)
-    if row['close'] <= row['LowerBand'] and row['BandWidth'] < 0.5:
-        score_long += 40
-    # For short: price touches upper band and low volatility
-    if row['close'] >= row['UpperBand'] and row['BandWidth'] < 0.5:
-        score_short += 40
-
-    # 2. RSI (25%)
-    # For long: oversold (<30)
-    if row['RSI'] < 30:
-        score_long += 25
-    # For short: overbought (>70)
-    if row['RSI'] > 70:
-        score_short += 25
-
-    # 3. MACD (20%)
-    # Check for bullish/bearish cross in the last two periods
-    if len(df) >= 2:
-        prev = df.iloc[-2]
-        # Bullish cross: previous MACD below Signal and now above
-        if prev['MACD'] < prev['Signal'] and row['MACD'] > row['Signal'] and row['MACD_Hist'] > 0:
-            score_long += 20
-        # Bearish cross: previous MACD above Signal and now below
-        if prev['MACD'] > prev['Signal'] and row['MACD'] < row['Signal'] and row['MACD_Hist'] < 0:
-            score_short += 20
-
-    # 4. Volume Confirmation (15%)
-    # For long: volume spike and OBV rising (compare last two OBV values)
-    if row['VolSpike'] and (df['OBV'].iloc[-1] > df['OBV'].iloc[-2]):
-        score_long += 15
-    # For short: volume spike and OBV falling
-    if row['VolSpike'] and (df['OBV'].iloc[-1] < df['OBV'].iloc[-2]):
-        score_short += 15
+    # Pull the last two bars out as plain floats in one go
+    last = df.iloc[-2:][_CONFLUENCE_COLS].to_numpy(dtype=np.float64)
+    if len(last) < 2:
+        # No previous bar: every cross/trend comparison below evaluates False
+        last = np.vstack((np.full(len(_CONFLUENCE_COLS), np.nan), last))
+    close, lower, upper, bw, rsi_val, macd_val, sig, hist, vol_spike, obv_val = last[1]
+    prev_macd, prev_sig, prev_obv = last[0, 5], last[0, 6], last[0, 9]
+
+    long_mask = np.array([
+        # 1. Bollinger Band Position + Squeeze (40%):
+        #    price touches lower band and low volatility (BandWidth < 0.5%)
+        close <= lower and bw < 0.5,
+        # 2. RSI (25%): oversold (<30)
+        rsi_val < 30,
+        # 3. MACD (20%): bullish cross, previous MACD below Signal and now above
+        prev_macd < prev_sig and macd_val > sig and hist > 0,
+        # 4. Volume Confirmation (15%): volume spike and OBV rising
+        bool(vol_spike) and obv_val > prev_obv,
+    ])
+    short_mask = np.array([
+        close >= upper and bw < 0.5,
+        rsi_val > 70,
+        prev_macd > prev_sig and macd_val < sig and hist < 0,
+        bool(vol_spike) and obv_val < prev_obv,
+    ])
+    score_long = int(long_mask @ _CONFLUENCE_W)
+    score_short = int(short_mask @ _CONFLUENCE_W)
 
     # Determine which side (if any) has sufficient confluence:
     # High confidence: >=85; Moderate: 60-84; else no trade
@@ -162,7 +393,8 @@ def calculate_position_size(account_risk, portfolio_value, atr_val, band_width):
 
 def calculate_trade_parameters(row, side):
     """
-    Given the latest row and trade side ('long' or 'short'), calculate:
+    Given the latest row (a Series or a dict of floats) and trade side
+    ('long' or 'short'), calculate:
       - Entry price
       - Stop loss (using min/max of volatility-based and fixed % risk)
       - Take Profit levels (TP1 = middle band, TP2 = upper/lower band)
@@ -195,24 +427,96 @@ def calculate_trade_parameters(row, side):
 # Telegram Bot Notification
 # ---------------------------
 
-def send_telegram_message(message):
+# Telegram caps a message at 4096 characters; leave room for separators
+TELEGRAM_MAX_CHARS = 4000
+
+# Outgoing alerts, drained by a single background sender task
+_telegram_queue = None
+_telegram_sender = None
+
+async def send_telegram_message(message):
     """
-    Sends a message using Telegram's Bot API.
+    Queue a message for Telegram's Bot API and return immediately.
+    Messages queued together are sent as one sendMessage call.
     Set environment variables TELEGRAM_TOKEN and TELEGRAM_CHAT_ID.
     """
+    global _telegram_queue, _telegram_sender
+    if _telegram_queue is None:
+        _telegram_queue = asyncio.Queue()
+    if _telegram_sender is None or _telegram_sender.done():
+        _telegram_sender = asyncio.create_task(_telegram_worker(_telegram_queue))
+    await _telegram_queue.put(message)
+
+async def flush_telegram_messages():
+    """Wait until every queued message is sent, then stop the sender task."""
+    global _telegram_sender
+    if _telegram_queue is not None:
+        await _telegram_queue.join()
+    if _telegram_sender is not None:
+        _telegram_sender.cancel()
+        _telegram_sender = None
+
+async def _telegram_worker(queue):
+    """Drain the queue, joining up to TELEGRAM_MAX_CHARS of messages per send."""
+    carry = None
+    while True:
+        message = carry if carry is not None else await queue.get()
+        carry = None
+        if len(message) > TELEGRAM_MAX_CHARS:
+            # Too long for one sendMessage: post it in pieces on its own
+            try:
+                for chunk in _split_telegram_message(message):
+                    await _post_telegram_message(chunk)
+            finally:
+                queue.task_done()
+            continue
+        batch = [message]
+        # Let other alerts raised in the same tick reach the queue
+        await asyncio.sleep(0)
+        size = len(batch[0])
+        while not queue.empty():
+            message = queue.get_nowait()
+            if size + len(message) + 2 > TELEGRAM_MAX_CHARS:
+                carry = message
+                break
+            batch.append(message)
+            size += len(message) + 2
+        try:
+            await _post_telegram_message("\n\n".join(batch))
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+def _split_telegram_message(message, limit=TELEGRAM_MAX_CHARS):
+    """Split a message into chunks of at most `limit` characters, at line breaks where possible."""
+    chunks = []
+    while len(message) > limit:
+        cut = message.rfind("\n", 0, limit + 1)
+        if cut <= 0:
+            cut = limit
+        chunks.append(message[:cut])
+        message = message[cut:].lstrip("\n")
+    if message:
+        chunks.append(message)
+    return chunks
+
+async def _post_telegram_message(text):
+    """Send one message using Telegram's Bot API."""
     token = os.environ.get("TELEGRAM_TOKEN")
     chat_id = os.environ.get("TELEGRAM_CHAT_ID")
     if not token or not chat_id:
         print("Telegram credentials not set.")
         return
     url = f"https://api.telegram.org/bot{token}/sendMessage"
-    payload = {"chat_id": chat_id, "text": message}
+    payload = {"chat_id": chat_id, "text": text}
     try:
-        response = requests.post(url, data=payload)
-        if response.status_code == 200:
-            print("Telegram message sent.")
-        else:
-            print("Failed to send Telegram message.")
+        session = await BaseStrategy.get_session()
+        async with session.post(url, data=payload,
+                                timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 200:
+                print("Telegram message sent.")
+            else:
+                print("Failed to send Telegram message.")
     except Exception as e:
         print(f"Error sending Telegram message: {e}")
 
@@ -221,27 +525,57 @@ def send_telegram_message(message):
 # ---------------------------
 
 class CryptoFuturesBot:
-    def __init__(self, account_risk=0.02, portfolio_value=100000):
+    def __init__(self, account_risk=0.02, portfolio_value=100000, use_polars=False):
         self.account_risk = account_risk
         self.portfolio_value = portfolio_value
+        # Run the indicator pipeline through strategies.polars_backend instead
+        self.use_polars = use_polars
 
     def prepare_data(self, df):
         """Calculate all indicators needed."""
-        df = bollinger_bands(df)
-        df = rsi(df)
-        df = macd(df)
-        df = atr(df)
-        df = obv(df)
-        df = volume_spike(df)
-        # Drop any rows with NaN values due to rolling calculations
-        df = df.dropna().reset_index(drop=True)
+        if self.use_polars:
+            from strategies.polars_backend import prepare_data as polars_prepare_data
+            return polars_prepare_data(df, _WARMUP)
+        if indicator_kernels is not None or NUMBA_AVAILABLE:
+            df = self._prepare_fused(df, ohlcv_arrays(df, np.float32))
+        else:
+            arrays = ohlcv_arrays(df)
+            df = bollinger_bands(df, arrays=arrays)
+            df = rsi(df, arrays=arrays)
+            df = macd(df, arrays=arrays)
+            df = atr(df, arrays=arrays)
+            df = obv(df, arrays=arrays)
+            df = volume_spike(df, arrays=arrays)
+        # Skip the warm-up rows left NaN by the rolling calculations; slicing
+        # avoids the full copy dropna().reset_index() would make
+        return df.iloc[_WARMUP:]
+
+    def _prepare_fused(self, df, arrays):
+        """
+        Fill every indicator column with one pass of the fused kernel,
+        using the precompiled build when present to skip the JIT compile.
+        """
+        high, low, close, vol = arrays['high'], arrays['low'], arrays['close'], arrays['volume']
+        n = len(close)
+        out = {name: np.empty(n) for name in (
+            'UpperBand', 'SMA', 'LowerBand', 'BandWidth', 'RSI',
+            'MACD', 'Signal', 'MACD_Hist', 'ATR', 'OBV', 'VolAvg')}
+        out['VolSpike'] = np.empty(n, dtype=np.bool_)
+        compute_all = indicator_kernels.compute_all if indicator_kernels is not None else _compute_all
+        compute_all(high, low, close, vol,
+                    out['UpperBand'], out['SMA'], out['LowerBand'], out['BandWidth'],
+                    out['RSI'], out['MACD'], out['Signal'], out['MACD_Hist'],
+                    out['ATR'], out['OBV'], out['VolAvg'], out['VolSpike'])
+        for name, values in out.items():
+            df[name] = values
         return df
 
     def analyze(self, df):
         """Analyze latest data and generate a trade signal and parameters."""
         df = self.prepare_data(df)
         signal, confidence = calculate_confluence_score(df)
-        latest = df.iloc[-1]
+        # Latest bar as plain floats rather than a boxed pandas row
+        latest = dict(zip(_TRADE_COLS, df.iloc[-1:][_TRADE_COLS].to_numpy(dtype=np.float64)[0]))
         band_width = latest['BandWidth']
         atr_val = latest['ATR']
         pos_size = calculate_position_size(self.account_risk, self.portfolio_value, atr_val, band_width)
@@ -264,7 +598,7 @@ class CryptoFuturesBot:
             trade_details = {"signal": "no trade", "confidence": confidence}
         return trade_details
 
-    def run(self, df):
+    async def run(self, df):
         """Run analysis and send Telegram alert if trade signal found."""
         trade = self.analyze(df)
         if trade["signal"] != "no trade":
@@ -273,7 +607,7 @@ class CryptoFuturesBot:
                        f"TP1 (Middle Band): {trade['take_profit1']:.2f}\nTP2 (Target Band): {trade['take_profit2']:.2f}\n"
                        f"Position Size: {trade['position_size']:.4f}\nRSI: {trade['RSI']:.2f}\nBand Width: {trade['band_width']:.2f}%")
             print(message)
-            send_telegram_message(message)
+            await send_telegram_message(message)
         else:
             print("No trade signal generated.")
 
@@ -290,5 +624,12 @@ if __name__ == "__main__":
         print("Error reading data.csv. Please ensure the file exists with correct columns.")
         raise e
 
-    bot = CryptoFuturesBot(account_risk=0.02, portfolio_value=100000)
-    bot.run(df)
+    async def main():
+        bot = CryptoFuturesBot(account_risk=0.02, portfolio_value=100000)
+        try:
+            await bot.run(df)
+            await flush_telegram_messages()
+        finally:
+            await BaseStrategy.close_session()
+
+    asyncio.run(main())
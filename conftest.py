@@ -0,0 +1,2 @@
+# conftest.py
+# Lets the tests import bot.py and the strategies package from the repo root.
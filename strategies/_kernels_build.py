@@ -0,0 +1,38 @@
+# strategies/_kernels_build.py
+"""
+Ahead-of-time build of the fused indicator kernel.
+
+Compiles bot._compute_all into the extension module
+strategies/indicator_kernels, so the first prepare_data call after start-up
+does not pay the numba JIT compile and numba is not needed at runtime.
+Run from the repository root (requires numba at build time):
+
+    python -m strategies._kernels_build
+"""
+import os
+
+from numba.pycc import CC
+
+from bot import _compute_all, kernel_fingerprint
+
+# high, low, close, volume (float32, see ohlcv_arrays), then the float64
+# outputs UpperBand, SMA, LowerBand, BandWidth, RSI, MACD, Signal,
+# MACD_Hist, ATR, OBV, VolAvg and the boolean VolSpike
+COMPUTE_ALL_SIGNATURE = "void({}, {}, b1[:])".format(
+    ", ".join(["f4[:]"] * 4), ", ".join(["f8[:]"] * 11)
+)
+
+def _constant_function(name, value):
+    """Build a no-argument function returning `value` as a literal, for cc.export."""
+    namespace = {}
+    exec(f"def {name}():\n    return {value!r}\n", namespace)
+    return namespace[name]
+
+cc = CC("indicator_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("compute_all", COMPUTE_ALL_SIGNATURE)(_compute_all.py_func)
+# bot.py compares this with kernel_fingerprint() and ignores a stale build
+cc.export("kernel_version", "i8()")(_constant_function("kernel_version", kernel_fingerprint()))
+
+if __name__ == "__main__":
+    cc.compile()
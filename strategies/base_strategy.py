@@ -1,35 +1,154 @@
 # strategies/base_strategy.py
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+
+import aiohttp
+import numpy as np
+import orjson
 import pandas as pd
 import talib
 
+logger = logging.getLogger(__name__)
+
+BINANCE_KLINES_URL = "https://api.binance.com/api/v3/klines"
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Outbound request limits for api.binance.com
+BINANCE_MAX_CONCURRENCY = 10
+BINANCE_MAX_RETRIES = 3
+# Longest Retry-After (seconds) we are willing to wait out on a 429
+BINANCE_MAX_BACKOFF = 5.0
+BINANCE_SEM = asyncio.Semaphore(BINANCE_MAX_CONCURRENCY)
+
+# Candle length in seconds for each Binance kline interval
+INTERVAL_SECONDS = {
+    "1m": 60, "3m": 180, "5m": 300, "15m": 900, "30m": 1800,
+    "1h": 3600, "2h": 7200, "4h": 14400, "6h": 21600, "8h": 28800,
+    "12h": 43200, "1d": 86400, "3d": 259200, "1w": 604800,
+}
+
+class BinanceRateLimitError(Exception):
+    """Binance rejected a request for exceeding its rate limit (429) or banned the IP (418)."""
+
+    def __init__(self, status, retry_after):
+        super().__init__(f"Binance rate limit hit ({status}), Retry-After {retry_after}s")
+        self.status = status
+        self.retry_after = retry_after
+
+def _retry_after_seconds(value, default=1.0):
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if value is None:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+# Klines cache: (symbol, interval, limit) -> (fetched_at, DataFrame)
+_CACHE = {}
+_CACHE_LOCKS = {}
+
 class BaseStrategy:
+    # Shared by every strategy instance; created lazily inside the running event loop
+    _session = None
+
+    @staticmethod
+    async def get_session():
+        """Return the shared aiohttp session, creating it on first use."""
+        if BaseStrategy._session is None or BaseStrategy._session.closed:
+            BaseStrategy._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+            )
+        return BaseStrategy._session
+
+    @staticmethod
+    async def close_session():
+        """Close the shared aiohttp session (call on shutdown)."""
+        if BaseStrategy._session is not None and not BaseStrategy._session.closed:
+            await BaseStrategy._session.close()
+        BaseStrategy._session = None
+
     def __init__(self, symbol="BTCUSDT", interval="1h", limit=100):
         self.symbol = symbol
         self.interval = interval
         self.limit = limit
 
-    def fetch_data(self):
-        """Fetch OHLCV data from Binance API."""
-        url = "https://api.binance.com/api/v3/klines"
+    async def fetch_data(self):
+        """
+        Fetch OHLCV data from Binance API.
+        Results are cached per (symbol, interval, limit) for half a candle,
+        so repeated requests within that window reuse the last download.
+        If a refresh fails (e.g. rate limited) the stale frame is returned
+        instead, without waiting out any backoff.
+        """
+        key = (self.symbol, self.interval, self.limit)
+        ttl = INTERVAL_SECONDS.get(self.interval, 60) * 0.5
+        lock = _CACHE_LOCKS.get(key)
+        if lock is None:
+            lock = _CACHE_LOCKS[key] = asyncio.Lock()
+        async with lock:
+            cached = _CACHE.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return cached[1].copy()
+            # Only back off on 429s when there is nothing cached to fall back on
+            df = await self._download(retry=cached is None)
+            if df is not None:
+                _CACHE[key] = (time.monotonic(), df)
+                return df.copy()
+            if cached is not None:
+                logger.warning(f"Serving stale klines for {self.symbol} {self.interval}")
+                return cached[1].copy()
+            return None
+
+    async def _download(self, retry=True):
+        """Download klines from Binance into a DataFrame (None on failure)."""
         params = {
             "symbol": self.symbol,
             "interval": self.interval,
             "limit": self.limit
         }
         try:
-            response = requests.get(url, params=params)
-            data = response.json()
-            df = pd.DataFrame(data, columns=[
-                "timestamp", "open", "high", "low", "close", "volume",
-                "close_time", "quote_asset_volume", "trades",
-                "taker_buy_base", "taker_buy_quote", "ignore"
-            ])
-            df["close"] = df["close"].astype(float)
-            return df
+            data = await self._get_klines(params, retry=retry)
+            # Binance rows are [open_time, open, high, low, close, volume, ...];
+            # keep only the OHLCV prices as one contiguous float64 block
+            arr = np.array([(row[1], row[2], row[3], row[4], row[5]) for row in data],
+                           dtype=np.float64)
+            return pd.DataFrame(arr.reshape(-1, len(OHLCV_COLUMNS)), columns=OHLCV_COLUMNS)
         except Exception as e:
             logger.error(f"Failed to fetch data: {e}")
             return None
 
+    async def _get_klines(self, params, retry=True):
+        """
+        GET the klines endpoint with at most BINANCE_MAX_CONCURRENCY requests
+        in flight. On a 429 it waits out Retry-After and tries again, up to
+        BINANCE_MAX_RETRIES times, but only when retry is set and the delay
+        is at most BINANCE_MAX_BACKOFF; otherwise, and on a 418 (IP ban),
+        it raises BinanceRateLimitError straight away.
+        """
+        session = await self.get_session()
+        for attempt in range(BINANCE_MAX_RETRIES + 1):
+            async with BINANCE_SEM:
+                async with session.get(BINANCE_KLINES_URL, params=params,
+                                       timeout=aiohttp.ClientTimeout(total=5)) as response:
+                    if response.status not in (418, 429):
+                        response.raise_for_status()
+                        return orjson.loads(await response.read())
+                    status = response.status
+                    retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+            if (status == 418 or not retry or attempt == BINANCE_MAX_RETRIES
+                    or retry_after > BINANCE_MAX_BACKOFF):
+                raise BinanceRateLimitError(status, retry_after)
+            # Sleep outside the semaphore so other requests are not held up
+            logger.warning(f"Binance rate limit hit ({status}), retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+
     def calculate_indicators(self, df):
         """Calculate indicators (override in child classes)."""
         raise NotImplementedError
@@ -1,4 +1,6 @@
 # strategies/bollinger_band.py
+import talib
+
 from .base_strategy import BaseStrategy
 
 class BollingerBandStrategy(BaseStrategy):
@@ -20,3 +22,14 @@ class BollingerBandStrategy(BaseStrategy):
         }
         score = sum(conditions.values())
         return "STRONG LONG" if score >= 3 else "NO TRADE"
+
+# Long-lived strategy instances keyed by (symbol, interval)
+_STRAT_POOL = {}
+
+def get_strategy(symbol, interval="1h"):
+    """Return the shared BollingerBandStrategy for a pair, creating it once."""
+    key = (symbol, interval)
+    strategy = _STRAT_POOL.get(key)
+    if strategy is None:
+        strategy = _STRAT_POOL[key] = BollingerBandStrategy(symbol=symbol, interval=interval)
+    return strategy
@@ -0,0 +1,93 @@
+# strategies/polars_backend.py
+"""
+Polars implementation of the CryptoFuturesBot indicator pipeline.
+
+All indicators are expressed as one lazy query, so Polars can plan and run
+them together across cores instead of materializing a pandas Series per
+step. Column names and values match CryptoFuturesBot.prepare_data.
+Polars is optional: install it with `pip install polars`.
+"""
+import pandas as pd
+import polars as pl
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+def klines_to_frame(klines):
+    """Build an OHLCV polars DataFrame from raw Binance kline rows."""
+    return pl.DataFrame(
+        [row[1:6] for row in klines], schema=OHLCV_COLUMNS, orient="row"
+    ).cast(pl.Float64)
+
+def _wilder_rma(x, period):
+    """
+    Wilder's RMA of x: seeded at row `period` with the mean of rows 1..period,
+    then an EMA with alpha=1/period (row 0 is the undefined first diff).
+    """
+    idx = pl.int_range(pl.len())
+    seeded = (
+        pl.when(idx < period).then(None)
+        .when(idx == period).then(x.rolling_mean(period))
+        .otherwise(x)
+    )
+    return seeded.ewm_mean(alpha=1 / period, adjust=False, ignore_nulls=True)
+
+def indicator_frame(frame, bb_window=20, num_std=2, rsi_period=14,
+                    fast=12, slow=26, signal_period=9, atr_period=14, vol_period=24):
+    """Return a LazyFrame adding every indicator column to an OHLCV frame."""
+    close = pl.col("close")
+    high = pl.col("high")
+    low = pl.col("low")
+    volume = pl.col("volume")
+    delta = close.diff().fill_null(0)
+    prev_close = close.shift(1)
+
+    return (
+        frame.lazy()
+        .with_columns(
+            # Bollinger Bands
+            close.rolling_mean(bb_window).alias("SMA"),
+            close.rolling_std(bb_window).alias("STD"),
+            # RSI
+            _wilder_rma(delta.clip(lower_bound=0), rsi_period).alias("AvgGain"),
+            _wilder_rma((-delta).clip(lower_bound=0), rsi_period).alias("AvgLoss"),
+            # MACD
+            close.ewm_mean(span=fast, adjust=False).alias("EMA_fast"),
+            close.ewm_mean(span=slow, adjust=False).alias("EMA_slow"),
+            # ATR (the first bar has no previous close, so its TR is high - low)
+            pl.max_horizontal(high - low, (high - prev_close).abs(), (low - prev_close).abs())
+            .rolling_mean(atr_period).alias("ATR"),
+            # OBV
+            (delta.sign() * volume).cum_sum().alias("OBV"),
+            # Volume spike
+            volume.rolling_mean(vol_period).alias("VolAvg"),
+        )
+        .with_columns(
+            (pl.col("SMA") + num_std * pl.col("STD")).alias("UpperBand"),
+            (pl.col("SMA") - num_std * pl.col("STD")).alias("LowerBand"),
+            (100 - 100 / (1 + pl.col("AvgGain") / (pl.col("AvgLoss") + 1e-10))).alias("RSI"),
+            (pl.col("EMA_fast") - pl.col("EMA_slow")).alias("MACD"),
+            (volume > 1.2 * pl.col("VolAvg")).fill_null(False).alias("VolSpike"),
+        )
+        .with_columns(
+            ((pl.col("UpperBand") - pl.col("LowerBand")) / close * 100).alias("BandWidth"),
+            pl.col("MACD").ewm_mean(span=signal_period, adjust=False).alias("Signal"),
+        )
+        .with_columns((pl.col("MACD") - pl.col("Signal")).alias("MACD_Hist"))
+        .drop("STD", "AvgGain", "AvgLoss", "EMA_fast", "EMA_slow")
+    )
+
+def prepare_data(df, warmup):
+    """
+    Polars counterpart of CryptoFuturesBot.prepare_data.
+    Accepts a pandas or polars OHLCV frame and returns a pandas DataFrame
+    without the first `warmup` rows, indexed by original position like the
+    NumPy path, for the existing pandas consumers.
+    """
+    if isinstance(df, pd.DataFrame):
+        index = df.index[warmup:]
+        df = pl.from_pandas(df)
+    else:
+        index = pd.RangeIndex(warmup, max(df.height, warmup))
+    out = indicator_frame(df).slice(warmup).collect().to_pandas()
+    out.index = index
+    return out
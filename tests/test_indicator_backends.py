@@ -0,0 +1,61 @@
+# tests/test_indicator_backends.py
+"""
+The indicators are implemented three times: the fused kernel, the TA-Lib
+helper chain and the Polars backend. Check that they agree on the same
+seeded OHLCV frame (within float32 rounding, which the fused path uses).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import bot
+
+RTOL = 1e-4
+ATOL = 1e-2
+
+def make_ohlcv(n=300, seed=42):
+    rng = np.random.default_rng(seed)
+    close = np.round(60000 + np.cumsum(rng.normal(0, 80, n)), 2)
+    close[50:53] = close[49]  # unchanged bars exercise OBV's zero direction
+    return pd.DataFrame({
+        "open": close,
+        "high": close + rng.uniform(0, 100, n),
+        "low": close - rng.uniform(0, 100, n),
+        "close": close,
+        "volume": rng.uniform(500, 3000, n),
+    })
+
+def helper_chain(df):
+    arrays = bot.ohlcv_arrays(df)
+    for indicator in (bot.bollinger_bands, bot.rsi, bot.macd, bot.atr, bot.obv, bot.volume_spike):
+        df = indicator(df, arrays=arrays)
+    return df
+
+def assert_frames_agree(actual, expected):
+    assert set(actual.columns) == set(expected.columns)
+    for col in expected.columns:
+        np.testing.assert_allclose(
+            actual[col].to_numpy(dtype=np.float64), expected[col].to_numpy(dtype=np.float64),
+            rtol=RTOL, atol=ATOL, err_msg=col,
+        )
+
+@pytest.mark.skipif(bot.indicator_kernels is None and not bot.NUMBA_AVAILABLE,
+                    reason="fused kernel needs numba or the AOT build")
+def test_fused_kernel_matches_helpers():
+    df = make_ohlcv()
+    fused = bot.CryptoFuturesBot()._prepare_fused(df.copy(), bot.ohlcv_arrays(df, np.float32))
+    # Full frames, so the NaN warm-up prefixes must line up as well
+    assert_frames_agree(fused, helper_chain(df.copy()))
+
+def test_polars_backend_matches_helpers():
+    polars_backend = pytest.importorskip("strategies.polars_backend")
+    df = make_ohlcv()
+    out = polars_backend.prepare_data(df.copy(), bot._WARMUP)
+    expected = helper_chain(df.copy()).iloc[bot._WARMUP:]
+    assert out.index.equals(expected.index)
+    assert_frames_agree(out, expected)
+
+def test_warmup_covers_every_nan():
+    df = helper_chain(make_ohlcv())
+    assert not df.iloc[bot._WARMUP:].isna().any().any()
+    assert df.iloc[bot._WARMUP - 1].isna().any()